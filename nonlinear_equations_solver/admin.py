@@ -7,7 +7,11 @@ class CalculationResultAdmin(admin.ModelAdmin):
     list_display = ['function_expression_short', 'method', 'root', 'iterations', 'converged', 'execution_time', 'created_at']
     list_filter = ['method', 'converged', 'created_at']
     search_fields = ['function_expression']
-    readonly_fields = ['created_at', 'convergence_rate']
+    readonly_fields = ['created_at', 'convergence_rate', 'iteration_history']
+    list_per_page = 25
+    list_max_show_all = 100
+    # Skip the unfiltered COUNT(*) on every changelist page
+    show_full_result_count = False
     
     fieldsets = (
         ('Function & Method', {
@@ -30,7 +34,8 @@ class CalculationResultAdmin(admin.ModelAdmin):
     function_expression_short.short_description = 'Function'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).order_by('-created_at')
+        # Ordering comes from Meta; the packed history is only needed on the change page
+        return super().get_queryset(request).defer('iteration_history_blob')
 
 
 @admin.register(ComparisonSession)
@@ -39,6 +44,10 @@ class ComparisonSessionAdmin(admin.ModelAdmin):
     list_filter = ['created_at', 'tolerance']
     search_fields = ['function_expression']
     readonly_fields = ['created_at']
+    list_per_page = 25
+    list_max_show_all = 100
+    # Skip the unfiltered COUNT(*) on every changelist page
+    show_full_result_count = False
     
     fieldsets = (
         ('Function', {
@@ -68,4 +77,4 @@ class ComparisonSessionAdmin(admin.ModelAdmin):
     methods_compared.short_description = 'Methods'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).order_by('-created_at')
+        return super().get_queryset(request).defer('results_summary')
@@ -0,0 +1,84 @@
+"""
+Compact binary storage for solver iteration histories.
+
+A history is a list of dicts sharing the same numeric keys, optionally
+followed by a few non-numeric entries (e.g. a failure message). It is
+stored as a one-line JSON header followed by the numeric columns as raw
+little-endian float64 values, one contiguous column after another, so a
+single column can be read back without decoding the rest.
+"""
+
+import json
+import numpy as np
+
+_HEADER_END = b'\n'
+_FLOAT64 = np.dtype('<f8')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def encode_history(history):
+    """Pack an iteration history into bytes"""
+    history = list(history or ())
+    columns = list(history[0]) if history else []
+
+    # Leading entries with the same purely numeric keys become columns,
+    # anything after the first irregular entry is kept as JSON
+    rows = 0
+    for step in history:
+        if not columns or list(step) != columns or not all(_is_number(v) for v in step.values()):
+            break
+        rows += 1
+    if rows == 0:
+        columns = []
+
+    integer_columns = [
+        name for name in columns
+        if all(isinstance(step[name], (int, np.integer)) for step in history[:rows])
+    ]
+    header = {
+        'columns': columns,
+        'integer_columns': integer_columns,
+        'rows': rows,
+        'extra': history[rows:],
+    }
+
+    data = np.array([[step[name] for step in history[:rows]] for name in columns], dtype=_FLOAT64)
+    return json.dumps(header, default=float).encode() + _HEADER_END + data.tobytes()
+
+
+def _split(blob):
+    blob = bytes(blob)
+    end = blob.index(_HEADER_END)
+    header = json.loads(blob[:end])
+    values = np.frombuffer(blob, dtype=_FLOAT64, offset=end + 1)
+    return header, values.reshape(len(header['columns']), header['rows'])
+
+
+def decode_history(blob):
+    """Unpack bytes produced by encode_history into a list of dicts"""
+    if not blob:
+        return []
+    header, values = _split(blob)
+    integer_columns = set(header['integer_columns'])
+
+    columns = []
+    for name, column in zip(header['columns'], values):
+        column = column.astype(np.int64) if name in integer_columns else column
+        columns.append(column.tolist())
+
+    history = [dict(zip(header['columns'], row)) for row in zip(*columns)]
+    history.extend(header['extra'])
+    return history
+
+
+def history_column(blob, name):
+    """Return one numeric column of an encoded history as a float64 array"""
+    if not blob:
+        return np.empty(0, dtype=_FLOAT64)
+    header, values = _split(blob)
+    if name not in header['columns']:
+        return np.empty(0, dtype=_FLOAT64)
+    return values[header['columns'].index(name)]
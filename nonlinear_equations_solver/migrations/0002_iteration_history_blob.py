@@ -0,0 +1,97 @@
+# Generated by Django 4.2.7 on 2026-10-14 08:56
+
+import json
+
+import numpy as np
+from django.db import migrations, models
+
+
+# Frozen copy of the history_encoding format this migration writes and reads;
+# later changes to that module must not change what the migration does
+_HEADER_END = b'\n'
+_FLOAT64 = np.dtype('<f8')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def encode_history(history):
+    history = list(history or ())
+    columns = list(history[0]) if history else []
+
+    rows = 0
+    for step in history:
+        if not columns or list(step) != columns or not all(_is_number(v) for v in step.values()):
+            break
+        rows += 1
+    if rows == 0:
+        columns = []
+
+    integer_columns = [
+        name for name in columns
+        if all(isinstance(step[name], (int, np.integer)) for step in history[:rows])
+    ]
+    header = {
+        'columns': columns,
+        'integer_columns': integer_columns,
+        'rows': rows,
+        'extra': history[rows:],
+    }
+
+    data = np.array([[step[name] for step in history[:rows]] for name in columns], dtype=_FLOAT64)
+    return json.dumps(header, default=float).encode() + _HEADER_END + data.tobytes()
+
+
+def decode_history(blob):
+    if not blob:
+        return []
+    blob = bytes(blob)
+    end = blob.index(_HEADER_END)
+    header = json.loads(blob[:end])
+    values = np.frombuffer(blob, dtype=_FLOAT64, offset=end + 1)
+    values = values.reshape(len(header['columns']), header['rows'])
+    integer_columns = set(header['integer_columns'])
+
+    columns = []
+    for name, column in zip(header['columns'], values):
+        column = column.astype(np.int64) if name in integer_columns else column
+        columns.append(column.tolist())
+
+    history = [dict(zip(header['columns'], row)) for row in zip(*columns)]
+    history.extend(header['extra'])
+    return history
+
+
+def pack_histories(apps, schema_editor):
+    CalculationResult = apps.get_model('nonlinear_equations_solver', 'CalculationResult')
+    for calc in CalculationResult.objects.only('pk', 'iteration_history').iterator():
+        calc.iteration_history_blob = encode_history(calc.iteration_history)
+        calc.save(update_fields=['iteration_history_blob'])
+
+
+def unpack_histories(apps, schema_editor):
+    CalculationResult = apps.get_model('nonlinear_equations_solver', 'CalculationResult')
+    for calc in CalculationResult.objects.only('pk', 'iteration_history_blob').iterator():
+        calc.iteration_history = decode_history(calc.iteration_history_blob)
+        calc.save(update_fields=['iteration_history'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nonlinear_equations_solver', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calculationresult',
+            name='iteration_history_blob',
+            field=models.BinaryField(help_text='Step-by-step iteration data', null=True),
+        ),
+        migrations.RunPython(pack_histories, unpack_histories),
+        migrations.RemoveField(
+            model_name='calculationresult',
+            name='iteration_history',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-14 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nonlinear_equations_solver', '0002_iteration_history_blob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calculationresult',
+            index=models.Index(fields=['-created_at'], name='nonlinear_e_created_caabb8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparisonsession',
+            index=models.Index(fields=['-created_at'], name='nonlinear_e_created_b81758_idx'),
+        ),
+    ]
@@ -1,5 +1,9 @@
 from django.db import models
+from functools import cached_property
 import json
+import numpy as np
+
+from .history_encoding import decode_history, encode_history, history_column
 
 class CalculationResult(models.Model):
     """Model to store calculation results"""
@@ -23,8 +27,8 @@ class CalculationResult(models.Model):
     converged = models.BooleanField(default=False)
     execution_time = models.FloatField(null=True, blank=True, help_text="Execution time in seconds")
     
-    # Detailed results (stored as JSON)
-    iteration_history = models.JSONField(default=list, help_text="Step-by-step iteration data")
+    # Detailed results (packed float64 columns, see history_encoding)
+    iteration_history_blob = models.BinaryField(null=True, help_text="Step-by-step iteration data")
     
     # Metadata
     tolerance = models.FloatField(default=1e-6)
@@ -33,33 +37,40 @@ class CalculationResult(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['-created_at'])]
         
     def __str__(self):
         return f"{self.get_method_display()} - {self.function_expression[:50]}"
     
     @property
+    def iteration_history(self):
+        """Step-by-step iteration data, decoded on access"""
+        return decode_history(self.iteration_history_blob)
+    
+    @iteration_history.setter
+    def iteration_history(self, history):
+        self.iteration_history_blob = encode_history(history)
+        # The cached rate was computed from the previous history
+        self.__dict__.pop('convergence_rate', None)
+    
+    @cached_property
     def convergence_rate(self):
-        """Calculate convergence rate if applicable"""
-        if not self.converged or len(self.iteration_history) < 2:
+        """Calculate convergence rate if applicable (computed once per instance)"""
+        if not self.converged:
             return None
             
-        errors = []
-        for step in self.iteration_history:
-            if 'error' in step:
-                errors.append(step['error'])
+        errors = history_column(self.iteration_history_blob, 'error')
         
-        if len(errors) < 3:
+        if errors.size < 3:
             return None
             
         # Calculate convergence rate using consecutive error ratios
-        ratios = []
-        for i in range(1, len(errors) - 1):
-            if errors[i] > 0 and errors[i+1] > 0:
-                ratio = errors[i+1] / errors[i]
-                if 0 < ratio < 1:  # Valid convergence ratio
-                    ratios.append(ratio)
+        previous, current = errors[1:-1], errors[2:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratios = current / previous
+        valid = (previous > 0) & (current > 0) & (ratios > 0) & (ratios < 1)  # Valid convergence ratios
         
-        return sum(ratios) / len(ratios) if ratios else None
+        return float(ratios[valid].mean()) if valid.any() else None
 
 
 class ComparisonSession(models.Model):
@@ -81,6 +92,7 @@ class ComparisonSession(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['-created_at'])]
         
     def __str__(self):
         return f"Comparison - {self.function_expression[:50]} - {self.created_at.strftime('%Y-%m-%d %H:%M')}"
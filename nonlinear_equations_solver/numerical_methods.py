@@ -17,13 +17,31 @@ Each method returns detailed results including:
 import numpy as np
 import time
 import math
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Callable, Tuple, List, Dict, Optional
-from sympy import symbols, diff, lambdify, sympify, SympifyError
+from numba import njit
+from numba.core import types as numba_types
+from numba.extending import is_jitted
+import sympy
+from sympy import Expr, symbols, diff, expand, lambdify, SympifyError
+from sympy.polys.polyerrors import PolynomialError
+from sympy.polys.polyfuncs import horner
+from sympy.parsing.sympy_parser import (
+    parse_expr, standard_transformations, implicit_multiplication, implicit_application,
+    convert_xor
+)
 
 
 class NumericalMethodResult:
     """Class to store results from numerical methods"""
     
+    # No per-instance __dict__: results are created on every solver exit
+    __slots__ = ('root', 'iterations', 'error', 'converged', 'method_name',
+                 'execution_time', 'iteration_history')
+    
     def __init__(self, root: float, iterations: int, error: float, 
                  converged: bool, method_name: str, execution_time: float,
                  iteration_history: List[Dict] = None):
@@ -48,10 +66,203 @@ class NumericalMethodResult:
         }
 
 
+def _elapsed(start_ns: int) -> float:
+    """Seconds elapsed since a ``time.perf_counter_ns()`` reading."""
+    return (time.perf_counter_ns() - start_ns) * 1e-9
+
+
+# Names a function string may use: SymPy's mathematical functions and constants
+# plus the classes the parser transformations emit. No Python builtins.
+_PARSER_GLOBALS = {
+    name: obj for name, obj in vars(sympy.functions).items()
+    if not name.startswith('_') and not isinstance(obj, types.ModuleType)
+}
+_PARSER_GLOBALS.update({
+    'Integer': sympy.Integer, 'Float': sympy.Float, 'Rational': sympy.Rational,
+    'Symbol': sympy.Symbol, 'Function': sympy.Function,
+    'pi': sympy.pi, 'E': sympy.E, 'abs': sympy.Abs, 'max': sympy.Max, 'min': sympy.Min,
+    '__builtins__': {},
+})
+
+# No split_symbols: names like "foo" or "sinx" must stay whole so they are
+# reported as unknown instead of being split into single-letter symbols
+_PARSER_TRANSFORMATIONS = standard_transformations + (
+    convert_xor, implicit_multiplication, implicit_application
+)
+
+
+def _parse_expression(func_str: str) -> Expr:
+    """
+    Parse a function string into a SymPy expression in the single variable x.
+    
+    Only whitelisted names are resolvable, dunder access is refused before
+    evaluation, and anything other than a real expression in x is rejected.
+    """
+    if '__' in func_str:
+        raise ValueError("Double underscores are not allowed in function expressions")
+    
+    x = symbols('x')
+    expr = parse_expr(func_str, local_dict={'x': x}, global_dict=_PARSER_GLOBALS,
+                      transformations=_PARSER_TRANSFORMATIONS, evaluate=True)
+    
+    if not isinstance(expr, Expr):
+        raise ValueError("Expression must evaluate to a mathematical expression in x")
+    unknown_symbols = expr.free_symbols - {x}
+    if unknown_symbols:
+        names = ', '.join(sorted(str(sym) for sym in unknown_symbols))
+        # Implicit multiplication also turns an unknown call like foo(x) into foo*x
+        raise ValueError(f"Unknown names: {names}. Only 'x' and SymPy's mathematical "
+                         f"functions and constants may be used")
+    
+    return expr
+
+
+# Numba dispatchers keyed by (function, signature). Compiling is guarded by a
+# lock: two threads compiling the same function would create two dispatcher
+# types, and every solver core would then be specialized twice
+_jitted_functions: Dict[Tuple[Callable, str], Callable] = {}
+_JITTED_FUNCTIONS_SIZE = 768
+_jit_lock = threading.Lock()
+
+
+def _jitted(func: Callable, signature: str = 'float64(float64)') -> Callable:
+    """
+    Compile a lambdified scalar function with Numba, on first use by a solver core.
+    
+    Compiling takes hundreds of milliseconds, so parsing does not do it up
+    front; only the history-free cores, which need nopython callables, ask
+    for it. Falls back to the plain Python function when the expression uses
+    something Numba cannot compile in nopython mode.
+    """
+    if is_jitted(func):
+        return func
+    key = (func, signature)
+    jitted = _jitted_functions.get(key)
+    if jitted is not None:
+        return jitted
+    
+    with _jit_lock:
+        # Another thread may have compiled it while this one waited
+        jitted = _jitted_functions.get(key)
+        if jitted is None:
+            try:
+                jitted = njit(signature, nogil=True)(func)
+            except Exception:
+                jitted = func
+            if len(_jitted_functions) >= _JITTED_FUNCTIONS_SIZE:
+                _jitted_functions.pop(next(iter(_jitted_functions)))
+            _jitted_functions[key] = jitted
+    return jitted
+
+
+# Every function passed to a jitted solver core adds a specialization of that
+# core, which Numba keeps for the life of the process. Past this many, new
+# functions run on the Python cores instead of growing the overload tables
+_CORE_SPECIALIZATIONS_SIZE = 512
+
+
+def _compile_for(core: Callable, *args) -> bool:
+    """
+    Compile a jitted solver core for the types of ``args`` without running it.
+    
+    Called before the timer starts, so ``execution_time`` never includes
+    Numba compilation. Trailing parameters left out of ``args`` compile with
+    their defaults, exactly as a call without them would.
+    
+    Returns:
+        False if the core has reached its specialization limit and the
+        Python core should be used instead
+    """
+    code = core.py_func.__code__
+    defaults = core.py_func.__defaults__ or ()
+    omitted = defaults[len(defaults) - (code.co_argcount - len(args)):] if code.co_argcount > len(args) else ()
+    signature = tuple(core.typeof_pyval(arg) for arg in args) + tuple(
+        numba_types.Omitted(default) for default in omitted
+    )
+    if signature not in core.overloads:
+        if len(core.overloads) >= _CORE_SPECIALIZATIONS_SIZE:
+            return False
+        core.compile(signature)
+    return True
+
+
+# Expressions whose printed form is longer than this are lambdified with
+# common subexpression elimination; for short ones CSE only adds temporaries
+_CSE_THRESHOLD = 200
+
+
+def _lambdify_scalar(x, expr: Expr) -> Callable:
+    """Lambdify a scalar expression with the 'math' backend, using CSE for large ones."""
+    return lambdify(x, expr, 'math', cse=len(str(expr)) > _CSE_THRESHOLD)
+
+
+def _evaluation_form(expr: Expr, x) -> Expr:
+    """
+    Rewrite expanded polynomials in Horner form so they evaluate without powers.
+    
+    Only sums of monomials are rewritten: factored input such as (x - 10)**6
+    is better conditioned as written than in its expanded Horner form.
+    """
+    if not (expr.is_Add and expr.is_polynomial(x) and expr == expand(expr)):
+        return expr
+    try:
+        return horner(expr, x)
+    except PolynomialError:
+        return expr
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: Expr) -> Tuple[Callable, Callable, Callable]:
+    """
+    Build the (function, derivative, fused) callables for a parsed expression.
+    
+    Keyed on the expression itself (SymPy hashes structurally), so different
+    spellings of the same expression share the same callables, and with
+    them a single Numba compilation.
+    """
+    x = symbols('x')
+    
+    # Create callable function
+    f_expr = _evaluation_form(expr, x)
+    f = _lambdify_scalar(x, f_expr)
+    
+    # Create derivative function (differentiating the original form)
+    df_expr = _evaluation_form(diff(expr, x), x)
+    df = _lambdify_scalar(x, df_expr)
+    
+    # Create fused (function, derivative) evaluator sharing common
+    # subexpressions such as x**2 between f and f'
+    fdf = lambdify(x, (f_expr, df_expr), 'math', cse=True)
+    
+    return f, df, fdf
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(func_str: str) -> Tuple[Callable, Callable, Callable]:
+    """Parse, differentiate and compile a normalized function string."""
+    return _compile_expression(_parse_expression(func_str))
+
+
+# lru_cache does not lock while computing, so concurrent first parses of an
+# expression would each build their own callables (and Numba dispatchers).
+# Parsing holds the GIL throughout, so serializing it costs no parallelism
+_parse_lock = threading.Lock()
+
+
+def _parse_normalized(func_str: str) -> Tuple[Callable, Callable, Callable]:
+    """Return the cached callables for a function string, parsing it at most once."""
+    with _parse_lock:
+        return _parse_cached(' '.join(func_str.split()))
+
+
 def parse_function(func_str: str) -> Tuple[Callable, Optional[Callable]]:
     """
     Parse a string representation of a function and return callable functions.
     
+    The callables are scalar ('math' backend) Python functions; the
+    history-free solver paths compile them with Numba on first use.
+    Results are cached, so repeated calls with the same expression are cheap.
+    
     Args:
         func_str: String representation of function (e.g., "x**3 - 6*x**2 + 11*x - 6")
         
@@ -59,24 +270,205 @@ def parse_function(func_str: str) -> Tuple[Callable, Optional[Callable]]:
         Tuple of (function, derivative_function)
     """
     try:
-        x = symbols('x')
-        expr = sympify(func_str)
+        # Collapse whitespace so trivially different inputs share a cache entry
+        f, df, _ = _parse_normalized(func_str)
+        return f, df
         
-        # Create callable function
-        f = lambdify(x, expr, 'numpy')
+    except (SympifyError, Exception) as e:
+        raise ValueError(f"Invalid function: {func_str}. Error: {str(e)}")
+
+
+def parse_fused_function(func_str: str) -> Callable:
+    """
+    Parse a function string and return a single callable computing (f(x), f'(x)).
+    
+    Both values are evaluated in one call with common subexpressions shared,
+    which halves the call overhead per Newton-Raphson iteration.
+    
+    Args:
+        func_str: String representation of function
         
-        # Create derivative function
-        df_expr = diff(expr, x)
-        df = lambdify(x, df_expr, 'numpy')
+    Returns:
+        Callable returning the tuple (f(x), f'(x))
+    """
+    try:
+        return _parse_normalized(func_str)[2]
         
-        return f, df
+    except (SympifyError, Exception) as e:
+        raise ValueError(f"Invalid function: {func_str}. Error: {str(e)}")
+
+
+@lru_cache(maxsize=256)
+def _parse_vectorized_cached(func_str: str) -> Callable:
+    """Parse a normalized function string into a NumPy-vectorized callable."""
+    x = symbols('x')
+    return lambdify(x, _parse_expression(func_str), 'numpy')
+
+
+def parse_vectorized_function(func_str: str) -> Callable:
+    """
+    Parse a function string into a callable that accepts NumPy arrays.
+    
+    Unlike ``parse_function``, the result evaluates a whole array of points
+    in a single call, which is what the array-based solvers need.
+    
+    Args:
+        func_str: String representation of function
+        
+    Returns:
+        Vectorized function
+    """
+    try:
+        return _parse_vectorized_cached(' '.join(func_str.split()))
         
     except (SympifyError, Exception) as e:
         raise ValueError(f"Invalid function: {func_str}. Error: {str(e)}")
 
 
+@njit(nogil=True)
+def _bisection_core(f, a, b, tolerance, max_iterations):
+    """History-free Bisection loop returning (root, iterations, error, converged)."""
+    fa = f(a)
+    fb = f(b)
+    if fa * fb > 0:
+        return math.nan, 0, math.inf, False
+    if abs(fa) < tolerance:
+        return a, 0, abs(fa), True
+    if abs(fb) < tolerance:
+        return b, 0, abs(fb), True
+    
+    for i in range(max_iterations):
+        c = (a + b) / 2
+        fc = f(c)
+        error = abs(b - a) / 2
+        if abs(fc) < tolerance or error < tolerance:
+            return c, i + 1, error, True
+        # Update interval without a data-dependent branch: the sign test is close
+        # to a coin flip near the root, and LLVM lowers these conditional
+        # expressions to select (cmov) instructions. Comparing signs instead
+        # of testing fa * fc < 0 cannot underflow to zero or overflow
+        root_in_left = (fa < 0.0) != (fc < 0.0)
+        b = c if root_in_left else b
+        a = a if root_in_left else c
+        fa = fa if root_in_left else fc
+    
+    return (a + b) / 2, max_iterations, abs(b - a) / 2, False
+
+
+@lru_cache(maxsize=256)
+def _fuse_njit(f: Callable, df: Callable) -> Callable:
+    """Combine jitted ``f`` and ``df`` into a jitted (f(x), f'(x)) evaluator."""
+    
+    @njit(nogil=True)
+    def fdf(x):
+        return f(x), df(x)
+    
+    return fdf
+
+
+@njit(nogil=True)
+def _newton_core(f, fdf, x0, tolerance, max_iterations):
+    """History-free Newton-Raphson loop returning (root, iterations, error, converged)."""
+    x = x0
+    for i in range(max_iterations):
+        fx, dfx = fdf(x)
+        if abs(dfx) < 1e-12:
+            return x, i, abs(fx), False
+        step = fx / dfx
+        x_new = x - step
+        error = abs(step)
+        if error < tolerance or abs(fx) < tolerance:
+            return x_new, i + 1, error, True
+        x = x_new
+    
+    return x, max_iterations, abs(f(x)), False
+
+
+# Step count for newton_fixed; enough for tolerance=1e-6 from a decent guess
+_NEWTON_FIXED_STEPS = 8
+
+
+@njit(inline='always', nogil=True)
+def newton_fixed(f, df, x0, tolerance, n=_NEWTON_FIXED_STEPS):
+    """
+    Run exactly ``n`` Newton-Raphson steps without stopping early.
+    
+    Without an early exit LLVM can unroll the loop and interleave the
+    evaluations of ``f`` and ``df``. The step at which the checking method
+    would have stopped is still recorded, with selects rather than branches.
+    
+    Returns:
+        Tuple of (x, iterations, error): the estimate after ``n`` steps, the
+        first iteration whose step or residual fell below ``tolerance`` (0 if
+        none did) and the step size at that iteration
+    """
+    x = x0
+    iterations = 0
+    error = math.inf
+    for i in range(n):
+        fx = f(x)
+        step = fx / df(x)
+        x = x - step
+        first = iterations == 0 and (abs(step) < tolerance or abs(fx) < tolerance)
+        iterations = i + 1 if first else iterations
+        error = abs(step) if first else error
+    return x, iterations, error
+
+
+def _newton_fixed_result(func: Callable, dfunc: Callable, x0: float,
+                         tolerance: float) -> Optional[NumericalMethodResult]:
+    """
+    Solve with ``newton_fixed``; return None unless one of its steps met ``tolerance``.
+    
+    Iterations and error are those of the step where newton_raphson_method
+    would have stopped, so the two results compare like-for-like.
+    """
+    x0 = float(x0)
+    jitted, djitted = _jitted(func), _jitted(dfunc)
+    if (is_jitted(jitted) and is_jitted(djitted)
+            and _compile_for(newton_fixed, jitted, djitted, x0, tolerance)):
+        solve, func, dfunc = newton_fixed, jitted, djitted
+    else:
+        solve = newton_fixed.py_func
+    
+    start_time = time.perf_counter_ns()
+    try:
+        root, iterations, error = solve(func, dfunc, x0, tolerance)
+    except (ZeroDivisionError, ValueError, OverflowError):
+        return None
+    execution_time = _elapsed(start_time)
+    
+    if iterations == 0 or not math.isfinite(root):
+        return None
+    return NumericalMethodResult(
+        root=root, iterations=iterations, error=error, converged=True,
+        method_name="Newton-Raphson", execution_time=execution_time
+    )
+
+
+@njit(nogil=True)
+def _secant_core(f, x0, x1, tolerance, max_iterations):
+    """History-free Secant loop returning (root, iterations, error, converged)."""
+    fx0 = f(x0)
+    fx1 = f(x1)
+    for i in range(max_iterations):
+        if abs(fx1 - fx0) < 1e-12:
+            return x1, i, abs(fx1), False
+        delta = fx1 * (x1 - x0) / (fx1 - fx0)
+        x2 = x1 - delta
+        fx2 = f(x2)
+        error = abs(delta)
+        if error < tolerance or abs(fx2) < tolerance:
+            return x2, i + 1, error, True
+        x0, x1 = x1, x2
+        fx0, fx1 = fx1, fx2
+    
+    return x1, max_iterations, abs(fx1), False
+
+
 def bisection_method(func: Callable, a: float, b: float, 
-                    tolerance: float = 1e-6, max_iterations: int = 100) -> NumericalMethodResult:
+                    tolerance: float = 1e-6, max_iterations: int = 100,
+                    collect_history: bool = True) -> NumericalMethodResult:
     """
     Implement the Bisection Method for finding roots.
     
@@ -96,19 +488,40 @@ def bisection_method(func: Callable, a: float, b: float,
         b: Right endpoint of initial interval
         tolerance: Convergence tolerance
         max_iterations: Maximum number of iterations
+        collect_history: Record per-iteration data; when False only the result
+            is computed, in nopython mode once ``func`` compiles with Numba
         
     Returns:
         NumericalMethodResult object containing results
     """
     
-    start_time = time.time()
+    if not collect_history:
+        a, b = float(a), float(b)
+        jitted = _jitted(func)
+        if is_jitted(jitted) and _compile_for(_bisection_core, jitted, a, b, tolerance, max_iterations):
+            core, func = _bisection_core, jitted
+        else:
+            core = _bisection_core.py_func
+        start_time = time.perf_counter_ns()
+        root, iterations, error, converged = core(func, a, b, tolerance, max_iterations)
+        execution_time = _elapsed(start_time)
+        iteration_history = []
+        if not converged and iterations == 0:
+            iteration_history = [{"error": "Root not bracketed in initial interval"}]
+        return NumericalMethodResult(
+            root=root, iterations=iterations, error=error, converged=converged,
+            method_name="Bisection", execution_time=execution_time,
+            iteration_history=iteration_history
+        )
+    
+    start_time = time.perf_counter_ns()
     iteration_history = []
     
     # Check if root is bracketed
     fa, fb = func(a), func(b)
     if fa * fb > 0:
         return NumericalMethodResult(
-            root=np.nan, iterations=0, error=np.inf, converged=False,
+            root=math.nan, iterations=0, error=math.inf, converged=False,
             method_name="Bisection", execution_time=0,
             iteration_history=[{"error": "Root not bracketed in initial interval"}]
         )
@@ -117,44 +530,47 @@ def bisection_method(func: Callable, a: float, b: float,
     if abs(fa) < tolerance:
         return NumericalMethodResult(
             root=a, iterations=0, error=abs(fa), converged=True,
-            method_name="Bisection", execution_time=time.time() - start_time
+            method_name="Bisection", execution_time=_elapsed(start_time)
         )
     if abs(fb) < tolerance:
         return NumericalMethodResult(
             root=b, iterations=0, error=abs(fb), converged=True,
-            method_name="Bisection", execution_time=time.time() - start_time
+            method_name="Bisection", execution_time=_elapsed(start_time)
         )
     
+    # Local lookups inside the loop
+    _abs = abs
+    _append = iteration_history.append
+    
     for i in range(max_iterations):
         # Calculate midpoint
         c = (a + b) / 2
         fc = func(c)
         
         # Calculate error
-        error = abs(b - a) / 2
+        error = _abs(b - a) / 2
         
         # Store iteration data
-        iteration_history.append({
+        _append({
             'iteration': i + 1,
             'a': a,
             'b': b,
             'c': c,
             'f(c)': fc,
-            'error': error,
-            'interval_width': b - a
+            'error': error
         })
         
         # Check convergence
-        if abs(fc) < tolerance or error < tolerance:
-            execution_time = time.time() - start_time
+        if _abs(fc) < tolerance or error < tolerance:
+            execution_time = _elapsed(start_time)
             return NumericalMethodResult(
                 root=c, iterations=i + 1, error=error, converged=True,
                 method_name="Bisection", execution_time=execution_time,
                 iteration_history=iteration_history
             )
         
-        # Update interval
-        if fa * fc < 0:
+        # Update interval (sign comparison avoids fa * fc underflowing to zero)
+        if (fa < 0) != (fc < 0):
             b = c
             fb = fc
         else:
@@ -163,7 +579,7 @@ def bisection_method(func: Callable, a: float, b: float,
     
     # Max iterations reached
     c = (a + b) / 2
-    execution_time = time.time() - start_time
+    execution_time = _elapsed(start_time)
     return NumericalMethodResult(
         root=c, iterations=max_iterations, error=abs(b - a) / 2, converged=False,
         method_name="Bisection", execution_time=execution_time,
@@ -171,8 +587,117 @@ def bisection_method(func: Callable, a: float, b: float,
     )
 
 
+def bisection_array(func: Callable, a: np.ndarray, b: np.ndarray,
+                    tolerance: float = 1e-6,
+                    max_iterations: int = 100) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the Bisection Method on many intervals at once.
+    
+    All brackets are bisected in lockstep: each iteration evaluates the
+    vectorized ``func`` once on the array of midpoints, and the intervals are
+    updated with masks instead of a Python-level loop over brackets.
+    
+    Args:
+        func: Vectorized function (see ``parse_vectorized_function``)
+        a: Left endpoints of the initial intervals
+        b: Right endpoints of the initial intervals
+        tolerance: Convergence tolerance
+        max_iterations: Maximum number of iterations
+        
+    Returns:
+        Tuple of (roots, iterations, converged) arrays; brackets that do not
+        contain a sign change get a NaN root and are reported as not converged
+    """
+    
+    a = np.array(a, dtype=np.float64)
+    b = np.array(b, dtype=np.float64)
+    
+    def evaluate(points):
+        return np.broadcast_to(np.asarray(func(points), dtype=np.float64), points.shape)
+    
+    # Both endpoint arrays in one call of the vectorized function
+    fa, fb = evaluate(np.stack((a, b)))
+    
+    roots = np.full(a.shape, np.nan)
+    iterations = np.zeros(a.shape, dtype=int)
+    converged = np.zeros(a.shape, dtype=bool)
+    
+    # Check if endpoints are roots, then drop brackets without a sign change
+    left_root = np.abs(fa) < tolerance
+    right_root = ~left_root & (np.abs(fb) < tolerance)
+    roots[left_root] = a[left_root]
+    roots[right_root] = b[right_root]
+    converged |= left_root | right_root
+    active = ~converged & (fa * fb < 0)
+    
+    for i in range(max_iterations):
+        if not active.any():
+            break
+        
+        c = 0.5 * (a + b)
+        fc = evaluate(c)
+        error = 0.5 * (b - a)
+        
+        done = active & ((np.abs(fc) < tolerance) | (error < tolerance))
+        roots[done] = c[done]
+        iterations[done] = i + 1
+        converged |= done
+        active &= ~done
+        
+        # Update intervals, comparing sign bits rather than multiplying
+        mask = np.signbit(fa) != np.signbit(fc)
+        b = np.where(mask, c, b)
+        a = np.where(mask, a, c)
+        fa = np.where(mask, fa, fc)
+    
+    # Max iterations reached
+    roots[active] = 0.5 * (a[active] + b[active])
+    iterations[active] = max_iterations
+    
+    return roots, iterations, converged
+
+
+def find_all_roots(func_str: str, domain: List[float], subdivisions: int = 200,
+                   tolerance: float = 1e-6, max_iterations: int = 100) -> List[float]:
+    """
+    Find every root of a function inside a domain with one vectorized bisection.
+    
+    The domain is scanned on a uniform grid; every sign change between
+    neighbouring grid points becomes a bracket, and all brackets are solved
+    together by ``bisection_array``. Roots closer together than the grid
+    spacing may be missed.
+    
+    Args:
+        func_str: String representation of function
+        domain: [x_min, x_max] interval to search, e.g. ``get_test_functions()[name]['domain']``
+        subdivisions: Number of grid intervals used to bracket roots
+        tolerance: Convergence tolerance
+        max_iterations: Maximum number of iterations
+        
+    Returns:
+        Sorted list of roots found
+    """
+    
+    func = parse_vectorized_function(func_str)
+    grid = np.linspace(domain[0], domain[1], subdivisions + 1)
+    
+    # Points outside the function's real domain evaluate to NaN and never bracket
+    with np.errstate(invalid='ignore', divide='ignore'):
+        values = np.broadcast_to(np.asarray(func(grid), dtype=np.float64), grid.shape)
+        sign_change = values[:-1] * values[1:] < 0
+    exact_roots = grid[values == 0]
+    
+    roots, _, converged = bisection_array(
+        func, grid[:-1][sign_change], grid[1:][sign_change], tolerance, max_iterations
+    )
+    
+    return sorted(exact_roots.tolist() + roots[converged].tolist())
+
+
 def newton_raphson_method(func: Callable, dfunc: Callable, x0: float,
-                         tolerance: float = 1e-6, max_iterations: int = 100) -> NumericalMethodResult:
+                         tolerance: float = 1e-6, max_iterations: int = 100,
+                         collect_history: bool = True,
+                         fdfunc: Optional[Callable] = None) -> NumericalMethodResult:
     """
     Implement the Newton-Raphson Method for finding roots.
     
@@ -192,47 +717,88 @@ def newton_raphson_method(func: Callable, dfunc: Callable, x0: float,
         x0: Initial guess
         tolerance: Convergence tolerance
         max_iterations: Maximum number of iterations
+        collect_history: Record per-iteration data; when False only the result
+            is computed, in nopython mode once the callables compile with Numba
+        fdfunc: Optional fused callable returning (f(x), f'(x)) in one call,
+            as produced by ``parse_fused_function``
         
     Returns:
         NumericalMethodResult object containing results
     """
     
-    start_time = time.time()
+    if not collect_history:
+        x0 = float(x0)
+        jitted, djitted = _jitted(func), _jitted(dfunc)
+        fdjitted = _jitted(fdfunc, 'UniTuple(float64, 2)(float64)') if fdfunc is not None else None
+        if is_jitted(jitted) and is_jitted(djitted):
+            if fdjitted is None or not is_jitted(fdjitted):
+                fdjitted = _fuse_njit(jitted, djitted)
+            jit_core = _compile_for(_newton_core, jitted, fdjitted, x0, tolerance, max_iterations)
+        else:
+            jit_core = False
+        
+        if jit_core:
+            core, func, fdfunc = _newton_core, jitted, fdjitted
+        else:
+            core = _newton_core.py_func
+            if fdfunc is None:
+                def fdfunc(x):
+                    return func(x), dfunc(x)
+        start_time = time.perf_counter_ns()
+        root, iterations, error, converged = core(func, fdfunc, x0, tolerance, max_iterations)
+        execution_time = _elapsed(start_time)
+        iteration_history = []
+        if not converged and iterations < max_iterations:
+            iteration_history = [{"error": "Derivative too close to zero"}]
+        return NumericalMethodResult(
+            root=root, iterations=iterations, error=error, converged=converged,
+            method_name="Newton-Raphson", execution_time=execution_time,
+            iteration_history=iteration_history
+        )
+    
+    start_time = time.perf_counter_ns()
     iteration_history = []
     
     x = x0
     
+    # Local lookups inside the loop
+    _abs = abs
+    _append = iteration_history.append
+    
     for i in range(max_iterations):
-        fx = func(x)
-        dfx = dfunc(x)
+        if fdfunc is not None:
+            fx, dfx = fdfunc(x)
+        else:
+            fx = func(x)
+            dfx = dfunc(x)
         
         # Check if derivative is zero (method fails)
-        if abs(dfx) < 1e-12:
-            execution_time = time.time() - start_time
+        if _abs(dfx) < 1e-12:
+            execution_time = _elapsed(start_time)
             return NumericalMethodResult(
-                root=x, iterations=i, error=abs(fx), converged=False,
+                root=x, iterations=i, error=_abs(fx), converged=False,
                 method_name="Newton-Raphson", execution_time=execution_time,
                 iteration_history=iteration_history + [{"error": "Derivative too close to zero"}]
             )
         
-        # Newton-Raphson iteration
-        x_new = x - fx / dfx
-        error = abs(x_new - x)
+        # Newton-Raphson iteration; the step is both the update and the error
+        step = fx / dfx
+        x_new = x - step
+        error = _abs(step)
         
         # Store iteration data
-        iteration_history.append({
+        _append({
             'iteration': i + 1,
             'x': x,
             'f(x)': fx,
             "f'(x)": dfx,
             'x_new': x_new,
-            'error': error,
-            'step_size': abs(fx / dfx)
+            'error': error
         })
         
         # Check convergence
-        if error < tolerance or abs(fx) < tolerance:
-            execution_time = time.time() - start_time
+        if error < tolerance or _abs(fx) < tolerance:
+            execution_time = _elapsed(start_time)
             return NumericalMethodResult(
                 root=x_new, iterations=i + 1, error=error, converged=True,
                 method_name="Newton-Raphson", execution_time=execution_time,
@@ -242,7 +808,7 @@ def newton_raphson_method(func: Callable, dfunc: Callable, x0: float,
         x = x_new
     
     # Max iterations reached
-    execution_time = time.time() - start_time
+    execution_time = _elapsed(start_time)
     return NumericalMethodResult(
         root=x, iterations=max_iterations, error=abs(func(x)), converged=False,
         method_name="Newton-Raphson", execution_time=execution_time,
@@ -251,7 +817,8 @@ def newton_raphson_method(func: Callable, dfunc: Callable, x0: float,
 
 
 def secant_method(func: Callable, x0: float, x1: float,
-                 tolerance: float = 1e-6, max_iterations: int = 100) -> NumericalMethodResult:
+                 tolerance: float = 1e-6, max_iterations: int = 100,
+                 collect_history: bool = True) -> NumericalMethodResult:
     """
     Implement the Secant Method for finding roots.
     
@@ -271,34 +838,60 @@ def secant_method(func: Callable, x0: float, x1: float,
         x1: Second initial guess
         tolerance: Convergence tolerance
         max_iterations: Maximum number of iterations
+        collect_history: Record per-iteration data; when False only the result
+            is computed, in nopython mode once ``func`` compiles with Numba
         
     Returns:
         NumericalMethodResult object containing results
     """
     
-    start_time = time.time()
+    if not collect_history:
+        x0, x1 = float(x0), float(x1)
+        jitted = _jitted(func)
+        if is_jitted(jitted) and _compile_for(_secant_core, jitted, x0, x1, tolerance, max_iterations):
+            core, func = _secant_core, jitted
+        else:
+            core = _secant_core.py_func
+        start_time = time.perf_counter_ns()
+        root, iterations, error, converged = core(func, x0, x1, tolerance, max_iterations)
+        execution_time = _elapsed(start_time)
+        iteration_history = []
+        if not converged and iterations < max_iterations:
+            iteration_history = [{"error": "Function values too close"}]
+        return NumericalMethodResult(
+            root=root, iterations=iterations, error=error, converged=converged,
+            method_name="Secant", execution_time=execution_time,
+            iteration_history=iteration_history
+        )
+    
+    start_time = time.perf_counter_ns()
     iteration_history = []
     
     fx0 = func(x0)
     fx1 = func(x1)
     
+    # Local lookups inside the loop
+    _abs = abs
+    _append = iteration_history.append
+    
     for i in range(max_iterations):
         # Check if function values are too close (method fails)
-        if abs(fx1 - fx0) < 1e-12:
-            execution_time = time.time() - start_time
+        if _abs(fx1 - fx0) < 1e-12:
+            execution_time = _elapsed(start_time)
             return NumericalMethodResult(
-                root=x1, iterations=i, error=abs(fx1), converged=False,
+                root=x1, iterations=i, error=_abs(fx1), converged=False,
                 method_name="Secant", execution_time=execution_time,
                 iteration_history=iteration_history + [{"error": "Function values too close"}]
             )
         
-        # Secant method iteration
-        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        # Secant method iteration; the correction is both the update and the error
+        delta = fx1 * (x1 - x0) / (fx1 - fx0)
+        x2 = x1 - delta
         fx2 = func(x2)
-        error = abs(x2 - x1)
+        error = _abs(delta)
         
         # Store iteration data
-        iteration_history.append({
+        _append({
             'iteration': i + 1,
             'x0': x0,
             'x1': x1,
@@ -306,13 +899,12 @@ def secant_method(func: Callable, x0: float, x1: float,
             'f(x1)': fx1,
             'x2': x2,
             'f(x2)': fx2,
-            'error': error,
-            'secant_slope': (fx1 - fx0) / (x1 - x0) if x1 != x0 else float('inf')
+            'error': error
         })
         
         # Check convergence
-        if error < tolerance or abs(fx2) < tolerance:
-            execution_time = time.time() - start_time
+        if error < tolerance or _abs(fx2) < tolerance:
+            execution_time = _elapsed(start_time)
             return NumericalMethodResult(
                 root=x2, iterations=i + 1, error=error, converged=True,
                 method_name="Secant", execution_time=execution_time,
@@ -324,7 +916,7 @@ def secant_method(func: Callable, x0: float, x1: float,
         fx0, fx1 = fx1, fx2
     
     # Max iterations reached
-    execution_time = time.time() - start_time
+    execution_time = _elapsed(start_time)
     return NumericalMethodResult(
         root=x1, iterations=max_iterations, error=abs(fx1), converged=False,
         method_name="Secant", execution_time=execution_time,
@@ -332,9 +924,32 @@ def secant_method(func: Callable, x0: float, x1: float,
     )
 
 
+# Shared by compare_methods for history-free comparisons only: the jitted
+# solver cores release the GIL, so the three methods really run in parallel.
+# History runs are Python loops holding the GIL and stay on the caller's thread,
+# so long requests cannot queue up unrelated ones behind them
+_comparison_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='compare_methods')
+
+
+def _compare_newton(func: Callable, dfunc: Callable, fdfunc: Callable, x0: float,
+                    tolerance: float, max_iterations: int,
+                    collect_history: bool) -> NumericalMethodResult:
+    """Newton-Raphson step of compare_methods, trying newton_fixed first without history."""
+    result = None
+    if not collect_history:
+        result = _newton_fixed_result(func, dfunc, x0, tolerance)
+    if result is None:
+        result = newton_raphson_method(
+            func, dfunc, x0, tolerance, max_iterations,
+            collect_history=collect_history, fdfunc=fdfunc
+        )
+    return result
+
+
 # Predefined test functions
+@lru_cache(maxsize=None)
 def get_test_functions():
-    """Return dictionary of predefined test functions"""
+    """Return dictionary of predefined test functions (shared, treat as read-only)"""
     return {
         'polynomial': {
             'expression': 'x**3 - 6*x**2 + 11*x - 6',
@@ -370,15 +985,24 @@ def get_test_functions():
 
 
 def compare_methods(func_str: str, initial_params: Dict, tolerance: float = 1e-6, 
-                   max_iterations: int = 100) -> Dict:
+                   max_iterations: int = 100, collect_history: bool = False) -> Dict:
     """
     Compare all three methods on the same function with given parameters.
     
+    Without history the methods are independent nopython loops and run
+    concurrently on a small thread pool; with history they run one after
+    another on the calling thread.
+    
     Args:
         func_str: String representation of function
         initial_params: Dictionary with method-specific parameters
         tolerance: Convergence tolerance
         max_iterations: Maximum iterations for each method
+        collect_history: Record per-iteration data for each method; off by
+            default so comparisons only run the history-free solver cores.
+            Without history, Newton-Raphson first tries a fixed number of
+            unchecked steps and only runs the checking variant when none
+            of them meets ``tolerance``
         
     Returns:
         Dictionary containing results from all methods
@@ -386,30 +1010,53 @@ def compare_methods(func_str: str, initial_params: Dict, tolerance: float = 1e-6
     
     try:
         func, dfunc = parse_function(func_str)
-        results = {}
+        fdfunc = parse_fused_function(func_str)
+        tasks = {}
         
         # Bisection method
         if 'bisection' in initial_params:
             params = initial_params['bisection']
-            results['bisection'] = bisection_method(
-                func, params['a'], params['b'], tolerance, max_iterations
+            tasks['bisection'] = partial(
+                bisection_method, func, params['a'], params['b'], tolerance,
+                collect_history=collect_history
             )
         
         # Newton-Raphson method  
         if 'newton' in initial_params:
             params = initial_params['newton']
-            results['newton'] = newton_raphson_method(
-                func, dfunc, params['x0'], tolerance, max_iterations
+            tasks['newton'] = partial(
+                _compare_newton, func, dfunc, fdfunc, params['x0'], tolerance,
+                collect_history=collect_history
             )
         
         # Secant method
         if 'secant' in initial_params:
             params = initial_params['secant']
-            results['secant'] = secant_method(
-                func, params['x0'], params['x1'], tolerance, max_iterations
+            tasks['secant'] = partial(
+                secant_method, func, params['x0'], params['x1'], tolerance,
+                collect_history=collect_history
             )
         
-        return results
+        if not collect_history:
+            # Compile the solver cores here, one after another: a pool thread
+            # compiling holds the GIL while the other methods are being timed
+            warm_up = list(tasks.values())
+            if 'newton' in initial_params:
+                warm_up.append(partial(
+                    newton_raphson_method, func, dfunc, initial_params['newton']['x0'], tolerance,
+                    collect_history=False, fdfunc=fdfunc
+                ))
+            for task in warm_up:
+                task(max_iterations=0)
+        
+        if collect_history:
+            return {method: task(max_iterations=max_iterations) for method, task in tasks.items()}
+        
+        futures = {
+            method: _comparison_pool.submit(task, max_iterations=max_iterations)
+            for method, task in tasks.items()
+        }
+        return {method: future.result() for method, future in futures.items()}
         
     except Exception as e:
         return {'error': str(e)}
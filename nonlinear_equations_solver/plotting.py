@@ -0,0 +1,190 @@
+"""
+Plotly figures for the calculation and comparison endpoints.
+
+Plotly is imported inside each generator, so it is only loaded by the
+first request that actually asks for a plot.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import orjson
+
+from .numerical_methods import parse_vectorized_function
+
+
+@lru_cache(maxsize=256)
+def _elementwise(func):
+    """np.vectorize wrapper for a scalar-only callable, built once per function"""
+    return np.vectorize(func, otypes=[np.float64])
+
+
+def generate_function_plot(func, function_expr, result, parameters):
+    """Generate interactive plot of function and root, reusing the already parsed func"""
+    import plotly.graph_objs as go
+    
+    try:
+        # Determine plot range
+        if 'a' in parameters and 'b' in parameters:
+            # Bisection method - use interval
+            x_min, x_max = parameters['a'] - 1, parameters['b'] + 1
+        else:
+            # Newton/Secant - use root vicinity
+            root = result.root if not np.isnan(result.root) else 0
+            x_min, x_max = root - 3, root + 3
+        
+        # Generate x values, about 50 samples per unit within [200, 1000]
+        x = np.linspace(x_min, x_max, min(1000, max(200, int((x_max - x_min) * 50))))
+        
+        try:
+            y = parse_vectorized_function(function_expr)(x)
+        except Exception:
+            # Fallback for functions that only evaluate on scalars
+            y = _elementwise(func)(x)
+        y = np.broadcast_to(y, x.shape).astype(np.float64)
+        # Handle potential overflow/underflow (in place; NaN stays a gap in the curve)
+        np.clip(y, -1e10, 1e10, out=y)
+        
+        # Create plotly figure
+        fig = go.Figure()
+        
+        # Add function curve
+        fig.add_trace(go.Scatter(
+            x=x, y=y,
+            mode='lines',
+            name=f'f(x) = {function_expr}',
+            line=dict(color='blue', width=2)
+        ))
+        
+        # Add x-axis (y=0 line)
+        fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.7)
+        
+        # Add root point if converged
+        if result.converged and not np.isnan(result.root):
+            fig.add_trace(go.Scatter(
+                x=[result.root], y=[0],
+                mode='markers',
+                name=f'Root ≈ {result.root:.6f}',
+                marker=dict(color='red', size=10, symbol='circle')
+            ))
+        
+        # Add iteration points for visualization
+        if result.method_name == 'Bisection' and result.iteration_history:
+            # Show interval convergence
+            intervals_x = []
+            intervals_y = []
+            for step in result.iteration_history[-5:]:  # Last 5 intervals
+                c = step.get('c', 0)
+                fc = step.get('f(c)', 0)
+                intervals_x.append(c)
+                intervals_y.append(fc)
+            
+            if intervals_x:
+                fig.add_trace(go.Scatter(
+                    x=intervals_x, y=intervals_y,
+                    mode='markers',
+                    name='Iteration points',
+                    marker=dict(color='green', size=6, symbol='cross')
+                ))
+        
+        # Update layout
+        fig.update_layout(
+            title=f'{result.method_name} Method - {function_expr}',
+            xaxis_title='x',
+            yaxis_title='f(x)',
+            showlegend=True,
+            height=400,
+            template='plotly_white'
+        )
+        
+        return orjson.dumps(fig.to_plotly_json(), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        
+    except Exception as e:
+        return orjson.dumps({'error': str(e)}).decode()
+
+
+def generate_comparison_plot(function_expr, results):
+    """Generate comparison plot showing all methods' performance"""
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+    
+    try:
+        # Create subplots for different metrics
+        fig = make_subplots(
+            rows=2, cols=2,
+            subplot_titles=('Iterations to Converge', 'Final Error', 'Execution Time', 'Convergence Rate'),
+            specs=[[{'type': 'bar'}, {'type': 'bar'}],
+                   [{'type': 'bar'}, {'type': 'bar'}]]
+        )
+        
+        methods = []
+        iterations = []
+        errors = []
+        times = []
+        
+        for method_name, result in results.items():
+            methods.append(method_name.title())
+            iterations.append(result.iterations if result.converged else 0)
+            errors.append(result.error if result.error and not np.isinf(result.error) else 0)
+            times.append(result.execution_time)
+        
+        # Add bar charts
+        fig.add_trace(go.Bar(x=methods, y=iterations, name='Iterations'), row=1, col=1)
+        fig.add_trace(go.Bar(x=methods, y=errors, name='Error'), row=1, col=2)
+        fig.add_trace(go.Bar(x=methods, y=times, name='Time (s)'), row=2, col=1)
+        
+        fig.update_layout(height=600, showlegend=False, title_text="Methods Comparison")
+        
+        return orjson.dumps(fig.to_plotly_json(), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        
+    except Exception as e:
+        return orjson.dumps({'error': str(e)}).decode()
+
+
+def generate_convergence_plot(results):
+    """Generate convergence history plot"""
+    import plotly.graph_objs as go
+    
+    try:
+        fig = go.Figure()
+        
+        for method_name, result in results.items():
+            if not result.iteration_history:
+                continue
+            
+            history = result.iteration_history
+            # Failure messages are strings and count as no error
+            errors = np.fromiter(
+                (0 if isinstance(error, str) else error
+                 for error in (step.get('error', 0) for step in history)),
+                dtype=np.float64, count=len(history)
+            )
+            
+            # Skip methods without a single plottable error (e.g. rejected up front)
+            if not (errors > 0).any():
+                continue
+            
+            # Only positive errors show on a log axis, the rest become gaps
+            iterations = np.arange(1, errors.size + 1)
+            errors = np.where(errors > 0, errors, np.nan)
+            
+            fig.add_trace(go.Scatter(
+                x=iterations, y=errors,
+                mode='lines+markers',
+                name=f'{method_name.title()} Method',
+                line=dict(width=2)
+            ))
+        
+        fig.update_layout(
+            title='Convergence History',
+            xaxis_title='Iteration',
+            yaxis_title='Error',
+            yaxis_type='log',
+            height=400,
+            template='plotly_white'
+        )
+        
+        return orjson.dumps(fig.to_plotly_json(), option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        
+    except Exception as e:
+        return orjson.dumps({'error': str(e)}).decode()
@@ -0,0 +1,21 @@
+"""
+JSON responses encoded with orjson.
+"""
+
+import orjson
+from django.http import HttpResponse
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonResponse(HttpResponse):
+    """
+    Drop-in replacement for JsonResponse serializing with orjson.
+
+    NumPy scalars and arrays are encoded natively; NaN and infinity become
+    null, so the body is always valid JSON for the browser.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=orjson.dumps(data, option=_OPTIONS), **kwargs)
@@ -0,0 +1,90 @@
+"""
+Typed request schemas for the solver API.
+
+Each schema validates a decoded JSON body once and either returns a fully
+typed request or raises RequestError carrying the message sent back to the
+client.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+# Starting parameters each method reads from a request (in solver argument
+# order), and the error returned when they are missing or not numeric
+METHOD_PARAMETERS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    'bisection': (('a', 'b'), 'Bisection method requires valid numeric values for left endpoint (a) and right endpoint (b)'),
+    'newton': (('x0',), 'Newton-Raphson method requires a valid numeric initial guess (x0)'),
+    'secant': (('x0', 'x1'), 'Secant method requires valid numeric values for both initial guesses (x0 and x1)'),
+}
+METHODS = frozenset(METHOD_PARAMETERS)
+
+
+class RequestError(ValueError):
+    """Raised when a request body fails validation"""
+
+
+def _settings(data) -> Tuple[str, float, int]:
+    """Validate the fields shared by every request: function, tolerance, max_iterations"""
+    function_expr = data.get('function')
+    if not function_expr:
+        raise RequestError('Function expression is required')
+
+    try:
+        tolerance = float(data.get('tolerance', 1e-6))
+        max_iterations = int(data.get('max_iterations', 100))
+    except (ValueError, TypeError) as e:
+        raise RequestError(f'Invalid numeric parameter: {str(e)}')
+
+    if tolerance <= 0:
+        raise RequestError('Tolerance must be positive')
+    if max_iterations <= 0:
+        raise RequestError('Maximum iterations must be positive')
+
+    return function_expr, tolerance, max_iterations
+
+
+def _parameters(method: str, values) -> Dict[str, float]:
+    """Read a method's starting parameters from a dict of raw values"""
+    names, invalid_message = METHOD_PARAMETERS[method]
+    try:
+        return {name: float(values.get(name)) for name in names}
+    except (AttributeError, ValueError, TypeError):
+        raise RequestError(invalid_message)
+
+
+@dataclass(frozen=True)
+class SolveRequest:
+    """Body of a single-method calculate request"""
+    method: str
+    function: str
+    tolerance: float
+    max_iterations: int
+    parameters: Dict[str, float]
+
+    @classmethod
+    def from_data(cls, data) -> 'SolveRequest':
+        method = data.get('method')
+        if not method:
+            raise RequestError('Method is required')
+        function_expr, tolerance, max_iterations = _settings(data)
+        if method not in METHODS:
+            raise RequestError(f'Unknown method: {method}. Available methods: bisection, newton, secant')
+        return cls(method, function_expr, tolerance, max_iterations, _parameters(method, data))
+
+
+@dataclass(frozen=True)
+class CompareRequest:
+    """Body of a compare request, with parameters for any subset of the methods"""
+    function: str
+    tolerance: float
+    max_iterations: int
+    initial_params: Dict[str, Dict[str, float]]
+
+    @classmethod
+    def from_data(cls, data) -> 'CompareRequest':
+        function_expr, tolerance, max_iterations = _settings(data)
+        initial_params = {
+            method: _parameters(method, data[method])
+            for method in METHOD_PARAMETERS if method in data
+        }
+        return cls(function_expr, tolerance, max_iterations, initial_params)
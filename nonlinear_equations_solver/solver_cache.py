@@ -0,0 +1,46 @@
+"""
+Per-expression solver factories.
+
+Parsing, differentiating and JIT-compiling an expression is by far the most
+expensive part of a request. The solvers returned here are already bound to
+the compiled function (and derivative), so repeated requests for the same
+expression go straight to the numerical methods.
+"""
+
+from functools import lru_cache, partial
+from typing import Callable, Dict
+
+from .numerical_methods import (
+    parse_function, parse_fused_function, bisection_method,
+    newton_raphson_method, secant_method
+)
+
+
+@lru_cache(maxsize=512)
+def _solvers_for(func_str: str) -> Dict[str, Callable]:
+    func, dfunc = parse_function(func_str)
+    fdfunc = parse_fused_function(func_str)
+    return {
+        'bisection': partial(bisection_method, func),
+        'newton': partial(newton_raphson_method, func, dfunc, fdfunc=fdfunc),
+        'secant': partial(secant_method, func),
+    }
+
+
+def get_solvers(func_str: str) -> Dict[str, Callable]:
+    """
+    Return the solvers for a function string, bound to its compiled callables.
+
+    Args:
+        func_str: String representation of function
+
+    Returns:
+        Dictionary mapping method name ('bisection', 'newton', 'secant') to its
+        solver. Each takes the remaining arguments of the corresponding method,
+        e.g. ``get_solvers(f)['bisection'](a, b, tol, maxit)``. Treat as read-only,
+        the dictionary is shared between calls.
+
+    Raises:
+        ValueError: If the function string cannot be parsed
+    """
+    return _solvers_for(' '.join(func_str.split()))
@@ -1,3 +1,92 @@
-from django.test import TestCase
+import math
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .history_encoding import decode_history, encode_history, history_column
+from .models import CalculationResult
+from .numerical_methods import parse_function
+
+
+class HistoryEncodingTests(SimpleTestCase):
+    """Round trips through the packed iteration history format"""
+
+    def test_round_trip_keeps_integer_columns(self):
+        history = [
+            {'iteration': 1, 'x': 0.5, 'error': 0.25},
+            {'iteration': 2, 'x': 0.75, 'error': 0.125},
+        ]
+        decoded = decode_history(encode_history(history))
+        self.assertEqual(decoded, history)
+        self.assertTrue(all(type(step['iteration']) is int for step in decoded))
+        self.assertTrue(all(type(step['x']) is float for step in decoded))
+
+    def test_round_trip_keeps_trailing_error_entries(self):
+        history = [
+            {'iteration': 1, 'x': 1.0, 'error': 0.5},
+            {'error': 'Derivative too close to zero'},
+        ]
+        self.assertEqual(decode_history(encode_history(history)), history)
+
+    def test_round_trip_of_error_only_history(self):
+        history = [{'error': 'Root not bracketed in initial interval'}]
+        self.assertEqual(decode_history(encode_history(history)), history)
+
+    def test_round_trip_keeps_non_finite_values(self):
+        history = [
+            {'iteration': 1, 'x': math.nan, 'error': math.inf},
+            {'iteration': 2, 'x': -math.inf, 'error': 1.0},
+        ]
+        decoded = decode_history(encode_history(history))
+        self.assertTrue(math.isnan(decoded[0]['x']))
+        self.assertEqual(decoded[0]['error'], math.inf)
+        self.assertEqual(decoded[1]['x'], -math.inf)
+        self.assertEqual(decoded[1]['error'], 1.0)
+
+    def test_empty_history(self):
+        self.assertEqual(decode_history(encode_history([])), [])
+        self.assertEqual(decode_history(encode_history(None)), [])
+        self.assertEqual(decode_history(None), [])
+        self.assertEqual(history_column(encode_history([]), 'error').size, 0)
+
+    def test_history_column(self):
+        history = [{'iteration': i + 1, 'error': 2.0 ** -i} for i in range(4)]
+        blob = encode_history(history + [{'error': 'Function values too close'}])
+        self.assertEqual(history_column(blob, 'error').tolist(), [1.0, 0.5, 0.25, 0.125])
+        self.assertEqual(history_column(memoryview(blob), 'iteration').tolist(), [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(history_column(blob, 'missing').size, 0)
+
+    def test_model_property_round_trip(self):
+        history = [{'iteration': i + 1, 'error': 10.0 ** -i} for i in range(5)]
+        result = CalculationResult(converged=True, iteration_history=history)
+        self.assertEqual(result.iteration_history, history)
+        self.assertAlmostEqual(result.convergence_rate, 0.1)
+
+
+class ExpressionParsingTests(SimpleTestCase):
+    """Validation of user supplied function expressions"""
+
+    def test_rejects_dunder_access(self):
+        with self.assertRaisesRegex(ValueError, 'Double underscores'):
+            parse_function("__import__('os')")
+        with self.assertRaisesRegex(ValueError, 'Double underscores'):
+            parse_function('x.__class__')
+
+    def test_rejects_builtin_calls(self):
+        for expr in ("open('x')", "eval('1')", "getattr(x, 'evalf')"):
+            with self.subTest(expr=expr), self.assertRaises(ValueError):
+                parse_function(expr)
+
+    def test_rejects_non_expressions(self):
+        with self.assertRaises(ValueError):
+            parse_function('[x]')
+
+    def test_reports_unknown_names(self):
+        for expr, name in (('foo(x)', 'foo'), ('sinx', 'sinx')):
+            with self.subTest(expr=expr), self.assertRaisesRegex(ValueError, f'Unknown names: {name}'):
+                parse_function(expr)
+
+    def test_implicit_notation_still_parses(self):
+        for expr, expected in (('2x', 2.6), ('x^2', 1.69), ('sin x', math.sin(1.3))):
+            with self.subTest(expr=expr):
+                f, df = parse_function(expr)
+                self.assertAlmostEqual(f(1.3), expected)
@@ -1,13 +1,17 @@
-from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-import json
+import logging
+import orjson
+
+from nonlinear_equations_solver.responses import OrjsonResponse
+
+logger = logging.getLogger(__name__)
 
 @csrf_exempt
 def test_calculate(request):
     """Simple test endpoint"""
     try:
-        data = json.loads(request.body)
-        print(f"Received data: {data}")
+        data = orjson.loads(request.body)
+        logger.debug("Received data: %s", data)
         
         # Simple response
         response_data = {
@@ -20,9 +24,9 @@ def test_calculate(request):
             'iteration_history': []
         }
         
-        print(f"Sending response: {response_data}")
-        return JsonResponse(response_data)
+        logger.debug("Sending response: %s", response_data)
+        return OrjsonResponse(response_data)
         
     except Exception as e:
-        print(f"Error in test_calculate: {e}")
-        return JsonResponse({'error': str(e)}, status=500)
\ No newline at end of file
+        logger.exception("Error in test_calculate: %s", e)
+        return OrjsonResponse({'error': str(e)}, status=500)
\ No newline at end of file